@@ -6,13 +6,26 @@ import re
 import threading
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Optional
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
-from .models import VibrationCommand
+from .models import COMMAND_PATTERN, VibrationCommand
 from .playback import PlaybackService
 
 LOGGER = logging.getLogger(__name__)
-API_PATH_PATTERN = re.compile(r"^/API/(?P<command>\d+-\d+(?:\.\d+)?(?:ms|s|m|h))$")
+# Built from COMMAND_PATTERN so the API accepts exactly the command grammar
+# (and the same time units) without keeping a second copy of the regex.
+API_PATH_PATTERN = re.compile(r"^/API/" + COMMAND_PATTERN.pattern.lstrip("^"))
+_IDLE_CONNECTION_TIMEOUT_SECONDS = 30
+
+# Served for every non-command path (including health-check pings), so it is
+# serialized once rather than per request.
+_READY_BODY = json.dumps(
+    {
+        "status": "ready",
+        "usage": "GET /API/{strength}-{duration}{unit}",
+        "example": "/API/5-1000ms",
+    }
+).encode("utf-8")
 
 
 class ApiServer:
@@ -45,22 +58,29 @@ class ApiServer:
         playback = self._playback
 
         class RequestHandler(BaseHTTPRequestHandler):
+            # Keep-alive lets clients that fire many pulses (game mods, scripts)
+            # reuse one connection instead of paying a TCP handshake per command.
+            # Every response sets Content-Length, which HTTP/1.1 requires here.
+            protocol_version = "HTTP/1.1"
+            # Release handler threads held by idle keep-alive connections.
+            timeout = _IDLE_CONNECTION_TIMEOUT_SECONDS
+
             def do_GET(self) -> None:
-                path = urlparse(self.path).path
+                # Only the path matters; dropping any query/fragment by hand is
+                # much cheaper than a full urlsplit(). Absolute-form targets
+                # ("GET http://host/API/..."), which HTTP/1.1 servers must
+                # accept, still go through urlsplit.
+                if self.path.startswith("/"):
+                    path = self.path.partition("?")[0].partition("#")[0]
+                else:
+                    path = urlsplit(self.path).path
                 match = API_PATH_PATTERN.match(path)
                 if not match:
-                    self._json_response(
-                        200,
-                        {
-                            "status": "ready",
-                            "usage": "GET /API/{strength}-{duration}{unit}",
-                            "example": "/API/5-1000ms",
-                        },
-                    )
+                    self._send_json_body(200, _READY_BODY)
                     return
 
                 try:
-                    command = VibrationCommand.parse(match.group("command"))
+                    command = VibrationCommand.from_match(match)
                     playback.pulse(command, source="http-api")
                 except ValueError as exc:
                     self._json_response(400, {"error": str(exc)})
@@ -80,7 +100,9 @@ class ApiServer:
                 )
 
             def _json_response(self, status: int, payload: dict) -> None:
-                body = json.dumps(payload).encode("utf-8")
+                self._send_json_body(status, json.dumps(payload).encode("utf-8"))
+
+            def _send_json_body(self, status: int, body: bytes) -> None:
                 self.send_response(status)
                 self.send_header("Content-Type", "application/json")
                 self.send_header("Access-Control-Allow-Origin", "*")
@@ -17,8 +17,12 @@ LOGGER = logging.getLogger(__name__)
 class Application:
     def __init__(self, config: AppConfig) -> None:
         self._config = config
-        driver = DryRunToyDriver() if config.dry_run else BluetoothLeToyDriver()
-        self._worker = CommandWorker(driver)
+        self._driver = (
+            DryRunToyDriver()
+            if config.dry_run
+            else BluetoothLeToyDriver(extended_advertising=config.extended_advertising)
+        )
+        self._worker = CommandWorker(self._driver)
         self._playback = PlaybackService(self._worker)
         self._api = ApiServer(config.host, config.port, self._playback)
 
@@ -57,6 +61,7 @@ class Application:
             self._api.stop()
             self._playback.stop_all()
             self._worker.stop()
+            self._driver.close()
 
     def run_gui(self) -> None:
         # Imported lazily so headless/sidecar builds don't need tkinter.
@@ -82,3 +87,4 @@ class Application:
             self._api.stop()
             self._playback.stop_all()
             self._worker.stop()
+            self._driver.close()
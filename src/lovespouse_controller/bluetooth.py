@@ -2,18 +2,33 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 import time
-from typing import Protocol
+from typing import Any, Coroutine, Optional, Protocol, Tuple, TypeVar
 
 LOGGER = logging.getLogger(__name__)
+_T = TypeVar("_T")
 
 # Maximum time to wait for the advertisement publisher to reach STARTED before
 # giving up. Without a bound a failed publisher would hang the worker forever.
 _START_TIMEOUT_SECONDS = 3.0
 
+# How long advertising keeps running after a command ends. A command that
+# arrives within this window takes the advertisement over instead of paying a
+# stop/start cycle; if none does, advertising stops.
+_IDLE_STOP_SECONDS = 0.2
+
+# Fixed manufacturer-data prefix; the per-level command bytes are appended to it.
+_PAYLOAD_PREFIX = "0000006db643ce97fe427c"
+
 
 class ToyDriver(Protocol):
-    def send(self, strength: int, duration_seconds: float) -> None:
+    def send(
+        self, strength: int, duration_seconds: float, cancel: Optional[threading.Event] = None
+    ) -> None:
+        """Output ``strength`` for ``duration_seconds``, returning early if ``cancel`` is set."""
+
+    def close(self) -> None:
         ...
 
 
@@ -30,9 +45,13 @@ class BluetoothLeToyDriver:
         "FC55F0",
         "C5175C",
     )
+    # Raw advertisement bytes per strength level, decoded once instead of on
+    # every command.
+    PAYLOADS = tuple(bytes.fromhex(_PAYLOAD_PREFIX + command) for command in COMMANDS)
 
-    def __init__(self) -> None:
+    def __init__(self, extended_advertising: bool = False) -> None:
         try:
+            import winsdk.windows.devices.bluetooth as bluetooth
             import winsdk.windows.devices.bluetooth.advertisement as advertisement
             import winsdk.windows.devices.radios as radios
             import winsdk.windows.storage.streams as streams
@@ -44,23 +63,110 @@ class BluetoothLeToyDriver:
                 "winsdk is required for Bluetooth LE control. Install it or run with --dry-run."
             ) from exc
 
+        self._bluetooth = bluetooth
         self._advertisement = advertisement
         self._streams = streams
         self._radios = radios
         self._started_status = BluetoothLEAdvertisementPublisherStatus.STARTED
         self._aborted_status = BluetoothLEAdvertisementPublisherStatus.ABORTED
+        self._stopping_status = BluetoothLEAdvertisementPublisherStatus.STOPPING
+        self._stopped_status = BluetoothLEAdvertisementPublisherStatus.STOPPED
+
+        # A single event loop serves every command, instead of asyncio.run
+        # creating and tearing one down per send.
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="bluetooth-event-loop",
+            daemon=True,
+        )
+        self._loop_thread.start()
+
+        # One publisher for the lifetime of the driver; each command only swaps
+        # the manufacturer data it carries instead of building a new publisher.
+        self._publisher = advertisement.BluetoothLEAdvertisementPublisher()
+        # Subscribed once for the driver's lifetime. Status transitions resolve
+        # whichever start/stop is currently waiting (see _expect_status).
+        self._status_waiter: Optional[Tuple[Any, asyncio.Future]] = None
+        self._status_token = self._publisher.add_status_changed(self._on_status_changed)
+        if extended_advertising:
+            self._enable_extended_advertising()
+        # Advertising outlives each command by _IDLE_STOP_SECONDS so the next
+        # command can take it over; these track that pending stop.
+        self._active_data = None
+        self._idle_stop: Optional[asyncio.TimerHandle] = None
+        self._stop_task: Optional[asyncio.Task] = None
+        # Manufacturer data (and its IBuffer) per strength level, built once so
+        # sending a command is just swapping which entry the publisher carries.
+        self._manufacturer_data = tuple(
+            self._build_manufacturer_data(payload) for payload in self.PAYLOADS
+        )
 
         # Turning the radio on up front means the very first pulse works and the
         # user gets an actionable message immediately instead of silent failure.
         self._ensure_radio_on()
 
-    def send(self, strength: int, duration_seconds: float) -> None:
-        command = self.COMMANDS[max(0, min(9, strength))]
-        asyncio.run(self._send_command_async(command, duration_seconds))
+    def _enable_extended_advertising(self) -> None:
+        # Extended advertisements (Windows 10 2004+) cut on-air latency, but
+        # only BLE 5 scanners receive them, hence opt-in with a legacy fallback.
+        # An adapter without LE extended advertising would accept the setting
+        # and then abort every start, so ask the adapter first.
+        try:
+            supported = self._run(self._extended_advertising_supported_async())
+            if supported:
+                self._publisher.use_extended_advertisement = True
+        except Exception:
+            LOGGER.warning(
+                "Extended advertising is not supported on this system; using legacy advertisements.",
+                exc_info=True,
+            )
+            return
+        if not supported:
+            LOGGER.warning(
+                "This Bluetooth adapter does not support extended advertising; "
+                "using legacy advertisements."
+            )
+            return
+        LOGGER.info("Using BLE extended advertisements.")
+
+    async def _extended_advertising_supported_async(self) -> bool:
+        adapter = await self._bluetooth.BluetoothAdapter.get_default_async()
+        return adapter is not None and adapter.is_extended_advertising_supported
+
+    def send(
+        self, strength: int, duration_seconds: float, cancel: Optional[threading.Event] = None
+    ) -> None:
+        manufacturer_data = self._manufacturer_data[max(0, min(9, strength))]
+        self._run(self._advertise_async(manufacturer_data))
+        # The hold runs on the calling (worker) thread rather than the loop so
+        # an interrupt can end it immediately.
+        try:
+            _hold(duration_seconds, cancel)
+        finally:
+            self._loop.call_soon_threadsafe(self._schedule_idle_stop)
+
+    def close(self) -> None:
+        """Shut down the driver's event loop; no commands can be sent afterwards."""
+
+        if self._loop.is_closed():
+            return
+        try:
+            self._run(self._shutdown_async())
+        except Exception:
+            LOGGER.debug("Failed to stop advertisement on shutdown.", exc_info=True)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=3)
+        if not self._loop_thread.is_alive():
+            self._loop.close()
+
+    def _run(self, coroutine: Coroutine[Any, Any, _T]) -> _T:
+        """Run ``coroutine`` on the driver's event loop and wait for its result."""
+
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
 
     def _ensure_radio_on(self) -> None:
         try:
-            asyncio.run(self._ensure_radio_on_async())
+            self._run(self._ensure_radio_on_async())
         except Exception:
             LOGGER.warning(
                 "Could not verify the Bluetooth radio state; make sure Bluetooth is turned on.",
@@ -112,48 +218,124 @@ class BluetoothLeToyDriver:
                 return radio
         return None
 
-    async def _send_command_async(self, command: str, duration_seconds: float) -> None:
-        advertisement = self._advertisement
-        publisher = advertisement.BluetoothLEAdvertisementPublisher()
-        manufacturer_data = advertisement.BluetoothLEManufacturerData()
+    def _build_manufacturer_data(self, payload: bytes):
+        manufacturer_data = self._advertisement.BluetoothLEManufacturerData()
         manufacturer_data.company_id = 0xFF
 
         writer = self._streams.DataWriter()
-        writer.write_bytes(bytearray.fromhex("0000006db643ce97fe427c" + command))
+        writer.write_bytes(payload)
         manufacturer_data.data = writer.detach_buffer()
-        publisher.advertisement.manufacturer_data.append(manufacturer_data)
-
-        loop = asyncio.get_running_loop()
-        started: asyncio.Future = loop.create_future()
-
-        def on_status_changed(_sender, args) -> None:
-            if started.done():
-                return
-            if args.status == self._started_status:
-                loop.call_soon_threadsafe(started.set_result, None)
-            elif args.status == self._aborted_status:
-                message = self._describe_abort(args.error)
-                loop.call_soon_threadsafe(
-                    started.set_exception, RuntimeError(message)
-                )
-
-        token = publisher.add_status_changed(on_status_changed)
+        return manufacturer_data
+
+    async def _advertise_async(self, manufacturer_data) -> None:
+        self._cancel_idle_stop()
+        if self._stop_task is not None:
+            await self._stop_task
+
+        # Back-to-back commands at the same level just keep the advertisement
+        # running; only a level change needs the stop/swap/start cycle.
+        publisher = self._publisher
+        if manufacturer_data is self._active_data and publisher.status == self._started_status:
+            return
+        if publisher.status == self._started_status:
+            await self._stop_publisher()
+        entries = publisher.advertisement.manufacturer_data
+        entries.clear()
+        entries.append(manufacturer_data)
+        self._active_data = None
+        try:
+            await self._start_publisher()
+        except Exception:
+            await self._stop_publisher()
+            raise
+        self._active_data = manufacturer_data
+
+    def _schedule_idle_stop(self) -> None:
+        self._cancel_idle_stop()
+        self._idle_stop = self._loop.call_later(_IDLE_STOP_SECONDS, self._stop_when_idle)
+
+    async def _shutdown_async(self) -> None:
+        # The last command leaves advertising running with an idle stop
+        # pending; stop it now rather than leave it to a loop that is going away.
+        self._cancel_idle_stop()
+        if self._stop_task is not None:
+            await self._stop_task
+        self._active_data = None
+        try:
+            await self._stop_publisher()
+        finally:
+            # The loop is about to close; a late WinRT status event must not
+            # try to schedule onto it.
+            self._publisher.remove_status_changed(self._status_token)
+
+    def _cancel_idle_stop(self) -> None:
+        if self._idle_stop is not None:
+            self._idle_stop.cancel()
+            self._idle_stop = None
+
+    def _stop_when_idle(self) -> None:
+        self._idle_stop = None
+        self._active_data = None
+        self._stop_task = self._loop.create_task(self._stop_publisher())
+        self._stop_task.add_done_callback(self._clear_stop_task)
+
+    def _clear_stop_task(self, task: asyncio.Task) -> None:
+        if self._stop_task is task:
+            self._stop_task = None
+
+    async def _start_publisher(self) -> None:
+        publisher = self._publisher
+        started = self._expect_status(self._started_status)
         try:
             publisher.start()
-            try:
-                await asyncio.wait_for(started, timeout=_START_TIMEOUT_SECONDS)
-            except asyncio.TimeoutError:
-                raise RuntimeError(
-                    "Bluetooth advertisement did not start within "
-                    f"{_START_TIMEOUT_SECONDS:.0f}s (status={publisher.status})."
-                )
-            await asyncio.sleep(duration_seconds)
+            await asyncio.wait_for(started, timeout=_START_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            raise RuntimeError(
+                "Bluetooth advertisement did not start within "
+                f"{_START_TIMEOUT_SECONDS:.0f}s (status={publisher.status})."
+            )
         finally:
-            try:
-                publisher.stop()
-            except Exception:
-                LOGGER.debug("Failed to stop advertisement.", exc_info=True)
-            publisher.remove_status_changed(token)
+            self._status_waiter = None
+
+    async def _stop_publisher(self) -> None:
+        publisher = self._publisher
+        stopped = self._expect_status(self._stopped_status)
+        try:
+            publisher.stop()
+            # The publisher is reused, so let it settle before the next
+            # command swaps its data and starts it again.
+            if publisher.status == self._stopping_status:
+                await asyncio.wait_for(stopped, timeout=_START_TIMEOUT_SECONDS)
+        except Exception:
+            LOGGER.debug("Failed to stop advertisement.", exc_info=True)
+        finally:
+            self._status_waiter = None
+
+    def _expect_status(self, status) -> asyncio.Future:
+        """Return a future resolved when the publisher next reports ``status``.
+
+        Must be called on the driver loop before triggering the transition, so
+        the notification cannot arrive before anyone is waiting for it.
+        """
+
+        future = self._loop.create_future()
+        self._status_waiter = (status, future)
+        return future
+
+    def _on_status_changed(self, _sender, args) -> None:
+        # Raised on a WinRT thread; hand the transition over to the driver loop.
+        self._loop.call_soon_threadsafe(self._handle_status, args.status, args.error)
+
+    def _handle_status(self, status, error) -> None:
+        if self._status_waiter is None:
+            return
+        expected, future = self._status_waiter
+        if future.done():
+            return
+        if status == expected:
+            future.set_result(None)
+        elif status == self._aborted_status:
+            future.set_exception(RuntimeError(self._describe_abort(error)))
 
     @staticmethod
     def _describe_abort(error) -> str:
@@ -167,6 +349,18 @@ class BluetoothLeToyDriver:
 
 
 class DryRunToyDriver:
-    def send(self, strength: int, duration_seconds: float) -> None:
+    def send(
+        self, strength: int, duration_seconds: float, cancel: Optional[threading.Event] = None
+    ) -> None:
         LOGGER.info("dry-run command strength=%s duration=%.3fs", strength, duration_seconds)
+        _hold(duration_seconds, cancel)
+
+    def close(self) -> None:
+        pass
+
+
+def _hold(duration_seconds: float, cancel: Optional[threading.Event]) -> None:
+    if cancel is None:
         time.sleep(duration_seconds)
+    else:
+        cancel.wait(duration_seconds)
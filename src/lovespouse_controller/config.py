@@ -18,6 +18,7 @@ class AppConfig:
     log_level: str = "INFO"
     theme: str = "light"
     headless: bool = False
+    extended_advertising: bool = False
 
     @classmethod
     def from_args(cls) -> "AppConfig":
@@ -58,6 +59,11 @@ class AppConfig:
             action="store_true",
             help="Run the HTTP API and BLE backend without the GUI (for use as a sidecar).",
         )
+        parser.add_argument(
+            "--extended-advertising",
+            action="store_true",
+            help="Use BLE 5 extended advertisements; only works if the toy can receive them.",
+        )
         args = parser.parse_args()
         return cls(
             host=args.host,
@@ -67,4 +73,5 @@ class AppConfig:
             log_level=args.log_level,
             theme=args.theme,
             headless=args.headless,
+            extended_advertising=args.extended_advertising,
         )
@@ -28,6 +28,10 @@ from .theme import DARK_THEME, LIGHT_THEME, Theme, configure_styles
 # patterns come from.
 ReloadCallback = Callable[[], Dict[str, Pattern]]
 
+# The slider fires on every pixel of a drag; output only follows it once it has
+# been still this long, so a drag retargets the device once instead of per pixel.
+STRENGTH_DEBOUNCE_MS = 50
+
 
 class IntensityMeter:
     """A segmented 0–9 bar drawn on a Canvas, filled up to the current level.
@@ -100,6 +104,7 @@ class ControllerWindow:
         self._patterns = patterns
         self._theme = theme
         self._reload_patterns = reload_patterns
+        self._pending_strength: Optional[str] = None
 
         self.root = tk.Tk()
         self.root.title("LoveSpouse Operations Console")
@@ -270,12 +275,18 @@ class ControllerWindow:
         strength = int(float(value))
         self.strength_label.config(text=str(strength))
         self._meter.set_value(strength)
+        self.mode_value.config(text="Manual continuous output" if strength else "Standby")
+        self._cancel_pending_strength()
+        self._pending_strength = self.root.after(
+            STRENGTH_DEBOUNCE_MS, lambda: self._apply_strength(strength)
+        )
+
+    def _apply_strength(self, strength: int) -> None:
+        self._pending_strength = None
         if strength == 0:
-            self.mode_value.config(text="Standby")
             self._playback.stop_all()
             self.set_status("Ready")
         else:
-            self.mode_value.config(text="Manual continuous output")
             self._playback.start_continuous(strength)
 
     def _play_selected_pattern(self, _event=None) -> None:
@@ -283,6 +294,7 @@ class ControllerWindow:
         if not selection:
             return
         display_name = selection[0]
+        self._cancel_pending_strength()
         self.strength_var.set(0)
         self.strength_label.config(text="0")
         self._meter.set_value(0)
@@ -290,6 +302,7 @@ class ControllerWindow:
         self._playback.play_pattern(self._patterns[display_name])
 
     def _stop(self, _event=None) -> None:
+        self._cancel_pending_strength()
         self.strength_var.set(0)
         self.strength_label.config(text="0")
         self._meter.set_value(0)
@@ -310,6 +323,11 @@ class ControllerWindow:
         self._apply_theme()
 
     # --- helpers ------------------------------------------------------------
+    def _cancel_pending_strength(self) -> None:
+        if self._pending_strength is not None:
+            self.root.after_cancel(self._pending_strength)
+            self._pending_strength = None
+
     def _populate_pattern_table(self) -> None:
         self.pattern_table.delete(*self.pattern_table.get_children())
         for index, (display_name, pattern) in enumerate(self._patterns.items()):
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Iterable, Tuple
 
 
 COMMAND_PATTERN = re.compile(r"^(?P<strength>\d+)-(?P<duration>\d+(?:\.\d+)?)(?P<unit>ms|s|m|h)$")
 
 _UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+# Longest suffix first so "ms" is not mistaken for "s" (see _merge).
+_UNITS_LONGEST_FIRST = sorted(_UNIT_SECONDS, key=len, reverse=True)
 
 
 @dataclass(frozen=True)
@@ -28,6 +31,15 @@ class VibrationCommand:
         match = COMMAND_PATTERN.match(text.strip())
         if not match:
             raise ValueError("expected command format '<strength>-<duration><ms|s>'")
+        return cls.from_match(match)
+
+    @classmethod
+    def from_match(cls, match: "re.Match[str]") -> "VibrationCommand":
+        """Build a command from a match carrying the ``COMMAND_PATTERN`` groups.
+
+        Lets callers that already matched a larger pattern (e.g. the API path)
+        reuse that match instead of running the regex a second time.
+        """
 
         value = float(match.group("duration"))
         unit = match.group("unit")
@@ -54,3 +66,29 @@ class Pattern:
         cls, name: str, author: str, commands: Iterable[VibrationCommand]
     ) -> "Pattern":
         return cls(name=name, author=author, commands=tuple(commands))
+
+    @cached_property
+    def playback_commands(self) -> Tuple[VibrationCommand, ...]:
+        """``commands`` with consecutive steps of equal strength merged into one.
+
+        Timing is unchanged but the worker gets one command per run of steps.
+        ``commands`` keeps the steps as written, which is what the UI counts.
+        """
+
+        merged = []
+        for command in self.commands:
+            if merged and merged[-1].strength == command.strength:
+                merged[-1] = _merge(merged[-1], command)
+            else:
+                merged.append(command)
+        return tuple(merged)
+
+
+def _merge(first: VibrationCommand, second: VibrationCommand) -> VibrationCommand:
+    total = first.duration_seconds + second.duration_seconds
+    # Report the merged duration in the first step's unit, at full precision.
+    unit = next(
+        (suffix for suffix in _UNITS_LONGEST_FIRST if first.original_duration.endswith(suffix)), "s"
+    )
+    value = f"{total / _UNIT_SECONDS[unit]:.9f}".rstrip("0").rstrip(".")
+    return VibrationCommand(first.strength, total, f"{value}{unit}")
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 
 from .models import Pattern, VibrationCommand
 
@@ -20,7 +21,7 @@ class PatternRepository:
             LOGGER.warning("pattern directory does not exist: %s", self._pattern_dir)
             return patterns
 
-        for path in sorted(self._pattern_dir.glob("*.vibepattern")):
+        for path in self._pattern_files():
             try:
                 pattern = self._read_pattern(path)
             except Exception:
@@ -30,6 +31,17 @@ class PatternRepository:
                 patterns[pattern.display_name] = pattern
         return patterns
 
+    def _pattern_files(self) -> List[Path]:
+        # scandir reports the entry type with the listing, so non-files are
+        # skipped without a stat call per entry. The extension check ignores
+        # case, matching how Windows (and the old glob there) treats names.
+        with os.scandir(self._pattern_dir) as entries:
+            return sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.lower().endswith(".vibepattern") and entry.is_file()
+            )
+
     def _read_pattern(self, path: Path) -> Pattern:
         lines = [line.strip() for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
         if not lines:
@@ -53,3 +65,4 @@ class PatternRepository:
             except ValueError:
                 LOGGER.warning("skipping invalid pattern command '%s' in %s", line, path)
         return Pattern.from_commands(name, author, commands)
+
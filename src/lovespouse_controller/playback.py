@@ -11,6 +11,10 @@ from .worker import CommandWorker
 LOGGER = logging.getLogger(__name__)
 StatusCallback = Callable[[str], None]
 
+# How far pattern playback may fall behind its schedule before it gives up
+# catching up and restarts timing from the current step.
+_MAX_LAG_SECONDS = 1.0
+
 
 class PlaybackService:
     def __init__(self, worker: CommandWorker, on_status: Optional[StatusCallback] = None) -> None:
@@ -19,6 +23,7 @@ class PlaybackService:
         self._continuous_stop = threading.Event()
         self._pattern_stop = threading.Event()
         self._continuous_thread: Optional[threading.Thread] = None
+        self._continuous_strength = 0
         self._pattern_thread: Optional[threading.Thread] = None
         self._lock = threading.RLock()
 
@@ -30,20 +35,27 @@ class PlaybackService:
 
     def start_continuous(self, strength: int) -> None:
         with self._lock:
-            self.stop_continuous(send_stop=False)
             if strength <= 0:
                 self.stop_all()
                 return
 
-            self._pattern_stop.set()
-            self._continuous_stop.clear()
-            self._continuous_thread = threading.Thread(
-                target=self._continuous_loop,
-                args=(strength,),
-                name="continuous-playback",
-                daemon=True,
-            )
-            self._continuous_thread.start()
+            # Changing the level of running output only retargets the existing
+            # loop; restarting the thread would stall output on every change.
+            self._continuous_strength = strength
+            thread = self._continuous_thread
+            if thread is None or not thread.is_alive():
+                self._pattern_stop.set()
+                pattern_thread = self._pattern_thread
+                if pattern_thread and pattern_thread.is_alive():
+                    pattern_thread.join(timeout=1)
+                self._worker.interrupt()
+                self._continuous_stop.clear()
+                self._continuous_thread = threading.Thread(
+                    target=self._continuous_loop,
+                    name="continuous-playback",
+                    daemon=True,
+                )
+                self._continuous_thread.start()
             self._on_status(f"Running - Level {strength}")
 
     def stop_continuous(self, send_stop: bool = True) -> None:
@@ -62,6 +74,7 @@ class PlaybackService:
             thread = self._pattern_thread
             if thread and thread.is_alive():
                 thread.join(timeout=1)
+            self._worker.interrupt()
 
             self._pattern_stop.clear()
             self._pattern_thread = threading.Thread(
@@ -80,22 +93,42 @@ class PlaybackService:
         if thread and thread.is_alive():
             thread.join(timeout=1)
         self._pattern_thread = None
+        # Without this the stop would queue behind the step being held, which
+        # for a long pattern step can be minutes.
+        self._worker.interrupt()
         self._worker.enqueue(VibrationCommand(0, 0.05), source="stop-all")
         self._on_status("Stopped")
 
-    def _continuous_loop(self, strength: int) -> None:
-        while not self._continuous_stop.is_set():
+    def _continuous_loop(self) -> None:
+        # Waiting on the stop event (rather than sleeping) lets stop_continuous
+        # wake the loop immediately instead of after the current tick.
+        while True:
+            strength = self._continuous_strength
             self._worker.enqueue(VibrationCommand(strength, 0.1), source="continuous")
-            time.sleep(0.1)
+            if self._continuous_stop.wait(0.1):
+                return
 
     def _pattern_loop(self, pattern: Pattern) -> None:
+        source = f"pattern:{pattern.name}"
+        # Steps are timed against absolute deadlines so per-step overhead does
+        # not drift long patterns, and waiting on the stop event (instead of
+        # sleeping) lets stop_all cancel mid-step rather than after it.
+        deadline = time.monotonic()
         try:
             while not self._pattern_stop.is_set():
-                for command in pattern.commands:
+                for command in pattern.playback_commands:
                     if self._pattern_stop.is_set():
                         break
-                    self._worker.enqueue(command, source=f"pattern:{pattern.name}")
-                    time.sleep(command.duration_seconds)
+                    self._worker.enqueue(command, source=source)
+                    # Small lateness is absorbed by the next step. Only after a
+                    # real stall (e.g. system suspend) is the schedule resynced,
+                    # so overdue steps are not enqueued back to back.
+                    now = time.monotonic()
+                    if now - deadline > _MAX_LAG_SECONDS:
+                        deadline = now
+                    deadline += command.duration_seconds
+                    if self._pattern_stop.wait(max(0.0, deadline - time.monotonic())):
+                        break
         finally:
             self._worker.enqueue(VibrationCommand(0, 0.05), source="pattern-stop")
             self._on_status("Ready")
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import queue
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 from .bluetooth import ToyDriver
@@ -16,18 +16,25 @@ LOGGER = logging.getLogger(__name__)
 class QueuedCommand:
     command: VibrationCommand
     source: str = "unknown"
+    # Shared by everything enqueued between two interrupts; setting it cuts the
+    # hold short and makes the worker skip the rest of that batch.
+    cancel: threading.Event = field(default_factory=threading.Event)
 
 
 class CommandWorker:
     def __init__(self, driver: ToyDriver) -> None:
         self._driver = driver
-        self._queue: "queue.Queue[Optional[QueuedCommand]]" = queue.Queue()
+        # SimpleQueue is the C-implemented unbounded FIFO: put/get without the
+        # task-tracking and condition-variable overhead of queue.Queue. It is
+        # deliberately unbounded so a stop command can never be dropped.
+        self._queue: "queue.SimpleQueue[Optional[QueuedCommand]]" = queue.SimpleQueue()
         self._thread = threading.Thread(
             target=self._run,
             name="bluetooth-command-worker",
             daemon=True,
         )
         self._started = threading.Event()
+        self._cancel = threading.Event()
 
     def start(self) -> None:
         if self._thread.is_alive():
@@ -36,7 +43,17 @@ class CommandWorker:
         self._started.wait(timeout=2)
 
     def enqueue(self, command: VibrationCommand, source: str = "unknown") -> None:
-        self._queue.put(QueuedCommand(command=command, source=source))
+        self._queue.put(QueuedCommand(command=command, source=source, cancel=self._cancel))
+
+    def interrupt(self) -> None:
+        """Cut short the command being held and drop everything already queued.
+
+        Commands enqueued after this call run normally, so a stop enqueued right
+        after an interrupt reaches the device without waiting out a long step.
+        """
+
+        cancel, self._cancel = self._cancel, threading.Event()
+        cancel.set()
 
     def stop(self) -> None:
         self.enqueue(VibrationCommand(0, 0.05), source="shutdown")
@@ -49,10 +66,12 @@ class CommandWorker:
         while True:
             item = self._queue.get()
             if item is None:
-                self._queue.task_done()
                 return
 
             command = item.command
+            if item.cancel.is_set():
+                LOGGER.debug("dropping interrupted command source=%s", item.source)
+                continue
             try:
                 LOGGER.debug(
                     "sending command source=%s strength=%s duration=%.3fs",
@@ -60,8 +79,6 @@ class CommandWorker:
                     command.strength,
                     command.duration_seconds,
                 )
-                self._driver.send(command.strength, command.duration_seconds)
+                self._driver.send(command.strength, command.duration_seconds, item.cancel)
             except Exception:
                 LOGGER.exception("command failed source=%s", item.source)
-            finally:
-                self._queue.task_done()
@@ -0,0 +1,54 @@
+import http.client
+import json
+import socket
+import unittest
+
+from lovespouse_controller.api import ApiServer
+
+
+class RecordingPlayback:
+    def __init__(self):
+        self.pulses = []
+
+    def pulse(self, command, source="api"):
+        self.pulses.append(command)
+
+
+def _free_port():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+class ApiServerTests(unittest.TestCase):
+    def setUp(self):
+        self.playback = RecordingPlayback()
+        self.port = _free_port()
+        self.server = ApiServer("127.0.0.1", self.port, self.playback)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+    def _get(self, target):
+        connection = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        try:
+            connection.request("GET", target)
+            response = connection.getresponse()
+            return response.status, json.loads(response.read())
+        finally:
+            connection.close()
+
+    def test_command_path_ignores_query_string(self):
+        status, body = self._get("/API/5-10ms?x=1")
+
+        self.assertEqual((status, body["status"]), (200, "ok"))
+        self.assertEqual(self.playback.pulses[0].strength, 5)
+
+    def test_accepts_absolute_form_target(self):
+        status, body = self._get(f"http://127.0.0.1:{self.port}/API/5-10ms")
+
+        self.assertEqual((status, body["status"]), (200, "ok"))
+        self.assertEqual(self.playback.pulses[0].duration_seconds, 0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
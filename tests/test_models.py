@@ -1,6 +1,7 @@
 import unittest
 
-from lovespouse_controller.models import VibrationCommand
+from lovespouse_controller.api import API_PATH_PATTERN
+from lovespouse_controller.models import Pattern, VibrationCommand
 
 
 class VibrationCommandTests(unittest.TestCase):
@@ -34,6 +35,25 @@ class VibrationCommandTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             VibrationCommand.parse("oops")
 
+    def test_from_match_reuses_api_path_match(self):
+        command = VibrationCommand.from_match(API_PATH_PATTERN.match("/API/7-1.5s"))
+
+        self.assertEqual(command, VibrationCommand.parse("7-1.5s"))
+        self.assertIsNone(API_PATH_PATTERN.match("/API/7-1.5x"))
+
+
+class PatternTests(unittest.TestCase):
+    def test_playback_commands_merge_consecutive_equal_strengths(self):
+        steps = [VibrationCommand.parse(text) for text in ("5-500ms", "5-0.5s", "2-1s", "5-1s")]
+        pattern = Pattern.from_commands("merge", "", steps)
+
+        merged = pattern.playback_commands
+
+        self.assertEqual(pattern.commands, tuple(steps))
+        self.assertEqual([command.strength for command in merged], [5, 2, 5])
+        self.assertEqual(merged[0].duration_seconds, 1.0)
+        self.assertEqual(merged[0].original_duration, "1000ms")
+
 
 if __name__ == "__main__":
     unittest.main()
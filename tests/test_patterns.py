@@ -21,6 +21,23 @@ class PatternRepositoryTests(unittest.TestCase):
         self.assertIn("Sample by QA", patterns)
         self.assertEqual([command.strength for command in patterns["Sample by QA"].commands], [1, 4])
 
+    def test_skips_directories_named_like_patterns(self):
+        with tempfile.TemporaryDirectory() as directory:
+            (Path(directory) / "folder.vibepattern").mkdir()
+            (Path(directory) / "real.vibepattern").write_text("2-1s\n", encoding="utf-8")
+
+            patterns = PatternRepository(Path(directory)).load()
+
+        self.assertEqual(list(patterns), ["real"])
+
+    def test_matches_extension_case_insensitively(self):
+        with tempfile.TemporaryDirectory() as directory:
+            (Path(directory) / "Upper.VibePattern").write_text("3-1s\n", encoding="utf-8")
+
+            patterns = PatternRepository(Path(directory)).load()
+
+        self.assertEqual(list(patterns), ["Upper"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,73 @@
+import threading
+import time
+import unittest
+
+from lovespouse_controller.models import Pattern, VibrationCommand
+from lovespouse_controller.playback import PlaybackService
+
+
+class RecordingWorker:
+    def __init__(self, enqueue_overhead=0.0):
+        self.enqueue_overhead = enqueue_overhead
+        self.sent = []
+        self.interrupts = 0
+        self.changed = threading.Condition()
+
+    def enqueue(self, command, source="unknown"):
+        time.sleep(self.enqueue_overhead)
+        with self.changed:
+            self.sent.append((time.monotonic(), command, source))
+            self.changed.notify_all()
+
+    def interrupt(self):
+        self.interrupts += 1
+
+    def wait_for(self, count, timeout=5):
+        with self.changed:
+            return self.changed.wait_for(lambda: len(self.sent) >= count, timeout)
+
+
+class PlaybackServiceTests(unittest.TestCase):
+    def test_pattern_steps_do_not_drift(self):
+        worker = RecordingWorker(enqueue_overhead=0.002)
+        playback = PlaybackService(worker)
+        steps = [VibrationCommand(1 + index % 2, 0.01) for index in range(100)]
+
+        playback.play_pattern(Pattern.from_commands("drift", "", steps))
+        self.assertTrue(worker.wait_for(101))
+        playback.stop_all()
+
+        elapsed = worker.sent[100][0] - worker.sent[0][0]
+        self.assertLess(elapsed, 1.1)
+
+    def test_pattern_plays_merged_steps(self):
+        worker = RecordingWorker()
+        playback = PlaybackService(worker)
+        steps = [VibrationCommand(5, 0.01), VibrationCommand(5, 0.01), VibrationCommand(2, 0.01)]
+
+        playback.play_pattern(Pattern.from_commands("merge", "", steps))
+        self.assertTrue(worker.wait_for(2))
+        playback.stop_all()
+
+        first, second = (command for _, command, _ in worker.sent[:2])
+        self.assertEqual((first.strength, first.duration_seconds), (5, 0.02))
+        self.assertEqual(second.strength, 2)
+
+    def test_stop_all_interrupts_the_step_being_held(self):
+        worker = RecordingWorker()
+        playback = PlaybackService(worker)
+        playback.play_pattern(Pattern.from_commands("long", "", [VibrationCommand(9, 60)]))
+        self.assertTrue(worker.wait_for(1))
+        interrupts_before = worker.interrupts
+
+        started = time.monotonic()
+        playback.stop_all()
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(worker.interrupts, interrupts_before + 1)
+        last_command, last_source = worker.sent[-1][1:]
+        self.assertEqual((last_command.strength, last_source), (0, "stop-all"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import threading
+import time
+import unittest
+
+from lovespouse_controller.models import VibrationCommand
+from lovespouse_controller.worker import CommandWorker
+
+
+class RecordingDriver:
+    def __init__(self):
+        self.sent = []
+        self.holding = threading.Event()
+
+    def send(self, strength, duration_seconds, cancel=None):
+        self.sent.append(strength)
+        self.holding.set()
+        cancel.wait(duration_seconds)
+
+    def close(self):
+        pass
+
+
+class CommandWorkerTests(unittest.TestCase):
+    def test_interrupt_ends_hold_and_drops_queued_commands(self):
+        driver = RecordingDriver()
+        worker = CommandWorker(driver)
+        worker.start()
+        worker.enqueue(VibrationCommand(9, 60))
+        worker.enqueue(VibrationCommand(5, 60))
+        self.assertTrue(driver.holding.wait(timeout=2))
+
+        started = time.monotonic()
+        worker.interrupt()
+        worker.enqueue(VibrationCommand(0, 0.01))
+        worker.stop()
+
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual(driver.sent, [9, 0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()